@@ -1,6 +1,23 @@
+import logging
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "accounts"
\ No newline at end of file
+    name = "accounts"
+
+    def ready(self) -> None:
+        from . import checks  # noqa: F401 - registers the system checks
+        from .encryption import MissingEncryptionKeyError, _get_cipher
+
+        # Decode the key and build the AES-GCM cipher at startup instead of
+        # on the first request that touches an email. A bad key must not
+        # stop migrate, collectstatic and the like: log it and let the first
+        # email access raise (checks.py reports it under manage.py check).
+        try:
+            _get_cipher()
+        except MissingEncryptionKeyError as e:
+            logger.warning("Email encryption key not loaded at startup: %s", e)
@@ -0,0 +1,31 @@
+"""
+System checks for the accounts app.
+
+Run with `python manage.py check` (and automatically before runserver and
+migrate). Problems are reported as warnings: unlike an exception in
+AppConfig.ready() (or a check Error) they don't stop unrelated management
+commands such as migrate or collectstatic.
+"""
+
+from django.core.checks import Tags, Warning, register
+
+from .encryption import MissingEncryptionKeyError, get_encryption_key
+
+
+@register(Tags.security)
+def check_email_encryption_key(app_configs, **kwargs):
+    """Report a missing or malformed ACCOUNT_EMAIL_ENCRYPTION_KEY."""
+    try:
+        get_encryption_key()
+    except MissingEncryptionKeyError as e:
+        return [
+            Warning(
+                f"Email encryption is not usable: {e}",
+                hint=(
+                    "Generate a key with: python -c \"from accounts.encryption "
+                    "import generate_encryption_key; print(generate_encryption_key())\""
+                ),
+                id="accounts.W001",
+            )
+        ]
+    return []
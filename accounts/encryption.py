@@ -23,13 +23,25 @@ For production systems, consider:
 import base64
 import hashlib
 import logging
-from typing import Optional
+import os
+import threading
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
 
+# Shared AES-GCM cipher, built once from the configured key (see _get_cipher)
+_AESGCM_SINGLETON: Optional[AESGCM] = None
+_AESGCM_LOCK = threading.Lock()
+
+# How many decrypted emails decrypt_email() remembers, keyed by ciphertext
+DECRYPT_CACHE_SIZE = 4096
+
 
 class EmailEncryptionError(Exception):
     """Base exception for email encryption/decryption errors."""
@@ -85,7 +97,76 @@ def get_encryption_key() -> bytes:
     return key
 
 
-def encrypt_email(email: str) -> bytes:
+def _get_cipher() -> AESGCM:
+    """
+    Return the shared AESGCM cipher, creating it on first use.
+
+    Building the cipher means reading settings, decoding and validating the
+    key, and setting up the AES key schedule. None of that changes between
+    calls, so it is done once per process and the instance is reused by
+    encrypt_email() and decrypt_email().
+
+    Returns:
+        AESGCM: Cipher initialized with the configured encryption key
+
+    Raises:
+        MissingEncryptionKeyError: If key is not configured or invalid
+    """
+    global _AESGCM_SINGLETON
+
+    cipher = _AESGCM_SINGLETON
+    if cipher is None:
+        with _AESGCM_LOCK:
+            cipher = _AESGCM_SINGLETON
+            if cipher is None:
+                cipher = AESGCM(get_encryption_key())
+                _AESGCM_SINGLETON = cipher
+    return cipher
+
+
+def _reset_cipher_cache() -> None:
+    """
+    Drop the shared cipher so the next call rebuilds it from settings.
+
+    Use this after key rotation when ACCOUNT_EMAIL_ENCRYPTION_KEY changes
+    at runtime. override_settings() in tests triggers it automatically
+    (see _reset_cipher_on_key_change).
+    """
+    global _AESGCM_SINGLETON
+
+    with _AESGCM_LOCK:
+        _AESGCM_SINGLETON = None
+    # Plaintexts decrypted under the old key must not outlive it
+    _decrypt_email_cached.cache_clear()
+
+
+@receiver(setting_changed)
+def _reset_cipher_on_key_change(*, setting: str, **kwargs) -> None:
+    """Signal: rebuild the cached cipher when the encryption key setting changes."""
+    if setting == "ACCOUNT_EMAIL_ENCRYPTION_KEY":
+        _reset_cipher_cache()
+
+
+def normalize_email_bytes(email: Union[str, bytes]) -> bytes:
+    """
+    Normalize an email and encode it for encryption or hashing.
+
+    Strips whitespace, lowercases, and UTF-8 encodes the address. Callers
+    that both encrypt and hash the same email can normalize once and pass
+    the bytes to encrypt_email() and generate_email_digest().
+
+    Args:
+        email: Email address, or bytes already returned by this function
+
+    Returns:
+        bytes: Normalized UTF-8 email (bytes input is returned unchanged)
+    """
+    if isinstance(email, bytes):
+        return email
+    return email.strip().lower().encode('utf-8')
+
+
+def encrypt_email(email: Union[str, bytes]) -> bytes:
     """
     Encrypt an email address using AES-256-GCM.
 
@@ -102,7 +183,7 @@ def encrypt_email(email: str) -> bytes:
     - NIST approved and widely supported
 
     Args:
-        email: Plaintext email address to encrypt
+        email: Plaintext email address to encrypt (or normalize_email_bytes() output)
 
     Returns:
         bytes: Encrypted email (nonce + ciphertext + auth_tag)
@@ -119,25 +200,21 @@ def encrypt_email(email: str) -> bytes:
     """
     try:
         # Normalize email to lowercase for consistent encryption/lookups
-        normalized_email = email.lower().strip()
+        normalized_email = normalize_email_bytes(email)
 
-        # Get the encryption key
-        key = get_encryption_key()
-
-        # Create AESGCM cipher with 256-bit key
-        aesgcm = AESGCM(key)
+        # Get the shared AESGCM cipher (256-bit key, built once)
+        aesgcm = _get_cipher()
 
         # Generate a unique nonce (IV) for this encryption
         # CRITICAL: Never reuse a nonce with the same key!
         # 96 bits (12 bytes) is standard for GCM mode
-        import os
         nonce = os.urandom(12)  # 96 bits = 12 bytes
 
         # Encrypt the email
         # GCM automatically adds authentication tag to ciphertext
         ciphertext = aesgcm.encrypt(
             nonce,
-            normalized_email.encode('utf-8'),
+            normalized_email,
             None  # No additional authenticated data (AAD)
         )
 
@@ -145,7 +222,7 @@ def encrypt_email(email: str) -> bytes:
         # Format: [nonce][ciphertext+tag]
         encrypted_data = nonce + ciphertext
 
-        logger.debug(f"Successfully encrypted email (length: {len(encrypted_data)} bytes)")
+        logger.debug("Successfully encrypted email (length: %d bytes)", len(encrypted_data))
         return encrypted_data
 
     except MissingEncryptionKeyError:
@@ -155,6 +232,46 @@ def encrypt_email(email: str) -> bytes:
         raise EmailEncryptionError(f"Failed to encrypt email: {e}")
 
 
+def encrypt_emails(emails: Iterable[Union[str, bytes]]) -> List[bytes]:
+    """
+    Encrypt many email addresses with AES-256-GCM in one call.
+
+    Same output format as encrypt_email(), for bulk paths (imports, data
+    migrations) where per-call overhead adds up:
+    - The shared cipher is fetched once for the whole batch
+    - All nonces come from a single os.urandom() call, sliced 12 bytes each
+      (every slice is used exactly once, so no nonce is ever reused)
+
+    Args:
+        emails: Plaintext email addresses (or normalize_email_bytes() output)
+
+    Returns:
+        list[bytes]: Encrypted emails, in the same order as the input
+
+    Raises:
+        EmailEncryptionError: If encryption fails
+        MissingEncryptionKeyError: If encryption key not configured
+    """
+    try:
+        normalized_emails = [normalize_email_bytes(email) for email in emails]
+        aesgcm = _get_cipher()
+
+        nonces = os.urandom(12 * len(normalized_emails))
+        encrypted = []
+        for index, email_bytes in enumerate(normalized_emails):
+            nonce = nonces[index * 12:(index + 1) * 12]
+            encrypted.append(nonce + aesgcm.encrypt(nonce, email_bytes, None))
+
+        logger.debug("Successfully encrypted %d emails", len(encrypted))
+        return encrypted
+
+    except MissingEncryptionKeyError:
+        raise  # Re-raise key errors as-is
+    except Exception as e:
+        logger.error(f"Bulk email encryption failed: {e}")
+        raise EmailEncryptionError(f"Failed to encrypt emails: {e}")
+
+
 def decrypt_email(encrypted_data: bytes) -> str:
     """
     Decrypt an email address encrypted with AES-256-GCM.
@@ -180,7 +297,21 @@ def decrypt_email(encrypted_data: bytes) -> str:
         >>> encrypted = encrypt_email("user@example.com")
         >>> decrypt_email(encrypted)
         'user@example.com'
+
+    Note:
+        Results are memoized per ciphertext (LRU, DECRYPT_CACHE_SIZE
+        entries), so a user reloaded on every request is decrypted once
+        per process rather than once per request. Every encryption uses a
+        fresh nonce, so equal ciphertext always means equal plaintext.
+        _reset_cipher_cache() clears the memo along with the cipher.
     """
+    # BinaryField may hand back memoryview (PostgreSQL); the cache needs bytes
+    return _decrypt_email_cached(bytes(encrypted_data) if encrypted_data else b"")
+
+
+@lru_cache(maxsize=DECRYPT_CACHE_SIZE)
+def _decrypt_email_cached(encrypted_data: bytes) -> str:
+    """Decrypt one email; the uncached body of decrypt_email()."""
     try:
         # Validate input
         if not encrypted_data or len(encrypted_data) < 13:
@@ -189,11 +320,8 @@ def decrypt_email(encrypted_data: bytes) -> str:
                 f"Invalid encrypted data: too short ({len(encrypted_data)} bytes)"
             )
 
-        # Get the encryption key
-        key = get_encryption_key()
-
-        # Create AESGCM cipher
-        aesgcm = AESGCM(key)
+        # Get the shared AESGCM cipher
+        aesgcm = _get_cipher()
 
         # Extract nonce and ciphertext
         nonce = encrypted_data[:12]  # First 12 bytes
@@ -205,7 +333,7 @@ def decrypt_email(encrypted_data: bytes) -> str:
         # Convert bytes back to string
         email = plaintext_bytes.decode('utf-8')
 
-        logger.debug(f"Successfully decrypted email")
+        logger.debug("Successfully decrypted email")
         return email
 
     except MissingEncryptionKeyError:
@@ -217,7 +345,51 @@ def decrypt_email(encrypted_data: bytes) -> str:
         )
 
 
-def generate_email_digest(email: str) -> str:
+def decrypt_emails(encrypted_values: Iterable[bytes]) -> List[str]:
+    """
+    Decrypt many encrypted emails in one call.
+
+    Same results as decrypt_email() per value, for bulk paths (exports,
+    admin reports, tests) next to encrypt_emails():
+    - The shared cipher is fetched once for the whole batch
+    - The per-ciphertext memo is bypassed, so a one-off export doesn't
+      evict the entries hot request paths rely on
+
+    Args:
+        encrypted_values: Encrypted emails (nonce + ciphertext + tag)
+
+    Returns:
+        list[str]: Decrypted emails, in the same order as the input
+
+    Raises:
+        DecryptionFailedError: If any value fails to decrypt
+        MissingEncryptionKeyError: If encryption key not configured
+    """
+    aesgcm = _get_cipher()
+    emails = []
+    try:
+        for encrypted_data in encrypted_values:
+            encrypted_data = bytes(encrypted_data) if encrypted_data else b""
+            if len(encrypted_data) < 13:
+                raise DecryptionFailedError(
+                    f"Invalid encrypted data: too short ({len(encrypted_data)} bytes)"
+                )
+            emails.append(
+                aesgcm.decrypt(encrypted_data[:12], encrypted_data[12:], None).decode('utf-8')
+            )
+    except DecryptionFailedError:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk email decryption failed: {e}")
+        raise DecryptionFailedError(
+            f"Failed to decrypt emails (corrupted data or wrong key): {e}"
+        )
+
+    logger.debug("Successfully decrypted %d emails", len(emails))
+    return emails
+
+
+def generate_email_digest(email: Union[str, bytes]) -> str:
     """
     Generate a SHA-256 digest of an email for lookups and uniqueness checks.
 
@@ -232,7 +404,7 @@ def generate_email_digest(email: str) -> str:
     It's for practical database operations with encrypted data.
 
     Args:
-        email: Email address to hash
+        email: Email address to hash (or normalize_email_bytes() output)
 
     Returns:
         str: 64-character hexadecimal SHA-256 digest
@@ -244,15 +416,57 @@ def generate_email_digest(email: str) -> str:
         'b4c9a289323b21a01c3e940f150eb9b8c542587f1abfd8f0e1cc1ffc5e475514'
     """
     # Normalize to lowercase for case-insensitive matching
-    normalized_email = email.lower().strip()
+    normalized_email = normalize_email_bytes(email)
 
     # Generate SHA-256 hash
-    digest = hashlib.sha256(normalized_email.encode('utf-8')).hexdigest()
+    digest = hashlib.sha256(normalized_email).hexdigest()
 
-    logger.debug(f"Generated email digest: {digest[:16]}...")
+    logger.debug("Generated email digest: %.16s...", digest)
     return digest
 
 
+def generate_email_digests(emails: Iterable[Union[str, bytes]]) -> List[str]:
+    """
+    Generate SHA-256 digests for many emails in one call.
+
+    Same output as generate_email_digest() per email, for bulk paths next
+    to encrypt_emails(). Skips the per-email debug logging and attribute
+    lookups; hashlib itself has no multi-buffer API, so each email is
+    still one SHA-256 call.
+
+    Args:
+        emails: Email addresses (or normalize_email_bytes() output)
+
+    Returns:
+        list[str]: 64-character hex digests, in the same order as the input
+    """
+    sha256 = hashlib.sha256
+    return [sha256(normalize_email_bytes(email)).hexdigest() for email in emails]
+
+
+def encrypt_and_digest(email: Union[str, bytes]) -> Tuple[bytes, str]:
+    """
+    Encrypt an email and generate its digest in one call.
+
+    Equivalent to (encrypt_email(email), generate_email_digest(email)),
+    but the email is normalized and encoded once and both AES-GCM and
+    SHA-256 read the same bytes object. This is what User uses whenever
+    an email is stored.
+
+    Args:
+        email: Plaintext email address (or normalize_email_bytes() output)
+
+    Returns:
+        tuple[bytes, str]: (encrypted email, 64-character hex digest)
+
+    Raises:
+        EmailEncryptionError: If encryption fails
+        MissingEncryptionKeyError: If encryption key not configured
+    """
+    email_bytes = normalize_email_bytes(email)
+    return encrypt_email(email_bytes), hashlib.sha256(email_bytes).hexdigest()
+
+
 def generate_encryption_key() -> str:
     """
     Generate a cryptographically secure 32-byte key for AES-256-GCM.
@@ -269,8 +483,6 @@ def generate_encryption_key() -> str:
         This key should be stored securely in .env file and NEVER committed to git.
         Back up this key safely - if lost, encrypted emails cannot be recovered!
     """
-    import os
-
     # Generate 32 random bytes (256 bits)
     key_bytes = os.urandom(32)
 
@@ -279,46 +491,3 @@ def generate_encryption_key() -> str:
 
     return key_b64
 
-
-# Convenience function for testing/demonstration
-def test_encryption_roundtrip(email: str = "test@example.com") -> bool:
-    """
-    Test encryption and decryption with a sample email.
-
-    This is useful for:
-    - Verifying encryption key is correctly configured
-    - Demonstrating encryption/decryption for MCO 1
-    - Debugging encryption issues
-
-    Args:
-        email: Test email address (default: test@example.com)
-
-    Returns:
-        bool: True if roundtrip successful, False otherwise
-    """
-    try:
-        print(f"\n=== Email Encryption Test ===")
-        print(f"Original email: {email}")
-
-        # Encrypt
-        encrypted = encrypt_email(email)
-        print(f"Encrypted (base64): {base64.b64encode(encrypted).decode()[:50]}...")
-        print(f"Encrypted size: {len(encrypted)} bytes")
-
-        # Generate digest
-        digest = generate_email_digest(email)
-        print(f"SHA-256 digest: {digest}")
-
-        # Decrypt
-        decrypted = decrypt_email(encrypted)
-        print(f"Decrypted email: {decrypted}")
-
-        # Verify
-        success = decrypted.lower() == email.lower()
-        print(f"Roundtrip successful: {success}")
-
-        return success
-
-    except Exception as e:
-        print(f"Encryption test failed: {e}")
-        return False
@@ -11,23 +11,92 @@ Forms:
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from django import forms
 from django.contrib.auth import password_validation
 from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
+from django.db import IntegrityError, transaction
+from django.dispatch import receiver
 
 from .models import Profile, User
 from .encryption import generate_email_digest
 
-# Validation patterns
-USERNAME_PATTERN = re.compile(r"^[A-Za-z0-9._-]{3,30}$")
-PASSWORD_SPECIAL_PATTERN = re.compile(r"[!@#$%^&*]")
+# Validation patterns (USERNAME_PATTERN is used with fullmatch, so no anchors)
+USERNAME_PATTERN = re.compile(r"[A-Za-z0-9._-]{3,30}")
+
+# Shapes a login identifier must have to possibly match a stored user.
+# Usernames follow Django's UnicodeUsernameValidator (minus "@", which
+# routes to the email branch) so admin-created accounts still match.
+LOGIN_USERNAME_PATTERN = re.compile(r"[\w.+-]+")
+LOGIN_EMAIL_PATTERN = re.compile(r"[^\s@]+@[^\s@]+")
+
+# Special characters accepted by the password strength rules
+PASSWORD_SPECIAL_CHARS = frozenset("!@#$%^&*")
 
 # Password requirements constants
 PASSWORD_MIN_LENGTH = 12
 
+# All strength rules in one pattern: uppercase, digit, special char, min length.
+# A match means the password is valid without running the individual checks.
+STRONG_PASSWORD_PATTERN = re.compile(
+    rf"(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*]).{{{PASSWORD_MIN_LENGTH},}}",
+    re.DOTALL,
+)
+
+
+# Django validator messages for rejected signup passwords, most recent last.
+# Keyed by SHA-256 of the password so no plaintext is held in memory.
+# Accepted passwords are never stored: only junk that can't become a
+# real credential (the bulk of repeated bot submissions) is memoized.
+SIGNUP_PASSWORD_CACHE_SIZE = 1024
+_rejected_signup_passwords: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+_rejected_signup_passwords_lock = threading.Lock()
+
+
+def _signup_password_errors(password: str) -> Tuple[str, ...]:
+    """
+    Run Django's password validators for a signup and return the messages.
+
+    Signup passes no user, so the result depends only on the password and
+    AUTH_PASSWORD_VALIDATORS. Rejections are remembered (bounded, LRU) so a
+    resubmitted bad password skips the validator chain. Not used by
+    ChangePasswordForm, whose check depends on the user's attributes.
+    """
+    key = hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+    with _rejected_signup_passwords_lock:
+        messages = _rejected_signup_passwords.get(key)
+        if messages is not None:
+            _rejected_signup_passwords.move_to_end(key)
+            return messages
+
+    try:
+        password_validation.validate_password(password)
+    except ValidationError as exc:
+        messages = tuple(exc.messages)
+    else:
+        return ()
+
+    with _rejected_signup_passwords_lock:
+        _rejected_signup_passwords[key] = messages
+        if len(_rejected_signup_passwords) > SIGNUP_PASSWORD_CACHE_SIZE:
+            _rejected_signup_passwords.popitem(last=False)
+    return messages
+
+
+@receiver(setting_changed)
+def _clear_rejected_signup_passwords(*, setting: str, **kwargs) -> None:
+    """Signal: forget memoized rejections when the password policy changes."""
+    if setting == "AUTH_PASSWORD_VALIDATORS":
+        with _rejected_signup_passwords_lock:
+            _rejected_signup_passwords.clear()
+
 
 def validate_password_strength(password: str) -> None:
     """
@@ -44,19 +113,36 @@ def validate_password_strength(password: str) -> None:
 
     Raises:
         ValidationError: If password doesn't meet requirements
+
+    Note:
+        Valid passwords are confirmed by a single STRONG_PASSWORD_PATTERN
+        match; the individual checks only run to build error messages,
+        and share one pass over the password.
     """
+    if STRONG_PASSWORD_PATTERN.fullmatch(password):
+        return
+
+    has_upper = has_digit = has_special = False
+    for ch in password:
+        if "A" <= ch <= "Z":
+            has_upper = True
+        elif ch.isdigit():
+            has_digit = True
+        elif ch in PASSWORD_SPECIAL_CHARS:
+            has_special = True
+
     errors = []
 
     if len(password) < PASSWORD_MIN_LENGTH:
         errors.append(f"Password must be at least {PASSWORD_MIN_LENGTH} characters long.")
 
-    if password.lower() == password:
+    if not has_upper:
         errors.append("Include at least one uppercase letter.")
 
-    if not any(ch.isdigit() for ch in password):
+    if not has_digit:
         errors.append("Include at least one number.")
 
-    if not PASSWORD_SPECIAL_PATTERN.search(password):
+    if not has_special:
         errors.append("Include at least one special character (!@#$%^&*).")
 
     if errors:
@@ -69,7 +155,8 @@ class SignupForm(forms.Form):
     
     Validates:
     - Username: 3-30 chars, alphanumeric with ._-
-    - Email: Valid format, not already used
+    - Email: Valid format
+    - Username and email not already used (one query, in clean())
     - Password: 12+ chars, uppercase, number, special char
     - Confirm password: Must match password
     """
@@ -79,70 +166,86 @@ class SignupForm(forms.Form):
     password = forms.CharField(widget=forms.PasswordInput)
     confirm_password = forms.CharField(widget=forms.PasswordInput)
 
+    # Digest computed by clean_email(), reused by save()
+    _email_digest: Optional[str] = None
+
     def clean_username(self) -> str:
         """
-        Validate username format and uniqueness.
+        Validate username format.
         
         Checks:
         - Matches pattern (3-30 chars, letters, numbers, ._-)
-        - Not already taken (case-insensitive)
+
+        Uniqueness (case-insensitive) is checked in clean(), together
+        with the email, so a signup costs one query instead of two.
         """
         username = self.cleaned_data["username"].strip()
         
-        if not USERNAME_PATTERN.match(username):
+        if not USERNAME_PATTERN.fullmatch(username):
             raise ValidationError(
                 "Choose 3-30 characters using letters, numbers, periods, underscores, or hyphens."
             )
         
-        if User.objects.filter(username__iexact=username).exists():
-            raise ValidationError("That username is already taken.")
-        
         return username
 
     def clean_email(self) -> str:
         """
-        Validate email format and uniqueness.
+        Normalize the email and compute its digest.
 
         Process:
         - Strip whitespace, convert to lowercase
-        - Generate SHA-256 digest
-        - Check if already registered (using digest for encrypted emails)
+        - Generate SHA-256 digest (used by clean() for the uniqueness
+          check and by save())
 
-        Note: Uses email_digest field for uniqueness check since emails
-        are encrypted and can't be directly compared.
+        Note: Uniqueness uses the email_digest field since emails are
+        encrypted and can't be directly compared.
         """
         email = self.cleaned_data["email"].strip().lower()
 
-        # Generate digest to check uniqueness
-        # This works with encrypted emails since digest is deterministic
-        email_digest = generate_email_digest(email)
-
-        # Check if digest already exists (means email is registered)
-        if User.objects.filter(email_digest=email_digest).exists():
-            raise ValidationError("That email is already registered.")
-
+        # Digest is deterministic, so it works as a lookup key for encrypted emails
+        self._email_digest = generate_email_digest(email)
         return email
 
     def clean(self) -> dict[str, str]:
         """
-        Validate password strength and confirmation.
+        Check uniqueness, then password strength and confirmation.
         
         Runs after individual field validation.
         Checks:
-        - Django's built-in password validators
+        - Username and email not already registered (single query via
+          User.objects.registration_conflicts)
+        - Password and confirmation match (cheap, so it runs first and
+          skips the validators below on mismatch)
+        - Django's built-in password validators (rejections memoized,
+          see _signup_password_errors)
         - Our custom strength requirements
-        - Password and confirmation match
         """
         data = super().clean()
+
+        username = data.get("username")
+        if username and self._email_digest:
+            username_taken, email_taken = User.objects.registration_conflicts(
+                username, self._email_digest
+            )
+            if username_taken:
+                self.add_error("username", "That username is already taken.")
+            if email_taken:
+                self.add_error("email", "That email is already registered.")
+
         password = data.get("password", "")
         confirm = data.get("confirm_password", "")
-        
+
+        # Check passwords match
+        if password and confirm and password != confirm:
+            self.add_error("confirm_password", "Passwords do not match.")
+            return data
+
         if password:
-            # Django validators (common passwords, similarity)
-            try:
-                password_validation.validate_password(password)
-            except ValidationError as exc:
-                self.add_error("password", exc)
+            # Django validators (common passwords, similarity);
+            # repeated rejections are answered from memory
+            messages = _signup_password_errors(password)
+            if messages:
+                self.add_error("password", list(messages))
             
             # Our custom requirements
             try:
@@ -150,29 +253,60 @@ class SignupForm(forms.Form):
             except ValidationError as exc:
                 self.add_error("password", exc)
 
-        # Check passwords match
-        if password and confirm and password != confirm:
-            self.add_error("confirm_password", "Passwords do not match.")
-
         return data
 
-    def save(self) -> User:
+    def save(self) -> Optional[User]:
         """
         Create new user with validated data.
         
         Process:
         - Calls User.objects.create_user()
+        - Reuses the email digest computed during validation
         - Password automatically hashed with Argon2
         - Profile auto-created via signal
+
+        clean() already checked uniqueness, but a concurrent signup can
+        take the same username or email before our INSERT. The database's
+        unique constraints (username_lower, email_digest) catch that; the
+        IntegrityError is turned into the usual field error and None is
+        returned, so the view treats it like any other invalid signup.
         """
         if not self.is_valid():
             raise ValueError("Cannot save an invalid form")
         
-        return User.objects.create_user(
-            username=self.cleaned_data["username"],
-            email=self.cleaned_data["email"],
-            password=self.cleaned_data["password"],
-        )
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(
+                    username=self.cleaned_data["username"],
+                    email=self.cleaned_data["email"],
+                    password=self.cleaned_data["password"],
+                    email_digest=self._email_digest,
+                )
+        except IntegrityError:
+            username_taken, email_taken = User.objects.registration_conflicts(
+                self.cleaned_data["username"], self._email_digest, refresh=True
+            )
+            if username_taken:
+                self.add_error("username", "That username is already taken.")
+            if email_taken:
+                self.add_error("email", "That email is already registered.")
+            if not (username_taken or email_taken):
+                self.add_error(None, "We couldn't create your account. Please try again.")
+            return None
+
+
+# Columns the login flow reads: check_password() and login() need the hash,
+# pk and is_active; save(update_fields=...) and its post_save receivers need
+# username, username_lower and email_digest. Email columns stay deferred.
+LOGIN_USER_FIELDS = (
+    "id",
+    "password",
+    "is_active",
+    "last_login",
+    "username",
+    "username_lower",
+    "email_digest",
+)
 
 
 class LoginForm(forms.Form):
@@ -186,9 +320,28 @@ class LoginForm(forms.Form):
     identifier = forms.CharField(max_length=150)
     password = forms.CharField(widget=forms.PasswordInput)
 
+    # Lookup key for find_user(), set once by clean_identifier():
+    # the digest for an email identifier, else the lowercased username
+    _email_digest: Optional[str] = None
+    _username_lower: Optional[str] = None
+
     def clean_identifier(self) -> str:
-        """Strip whitespace from username/email."""
-        return self.cleaned_data["identifier"].strip()
+        """
+        Strip whitespace from username/email and precompute its lookup key.
+
+        Emails get their SHA-256 digest, usernames their lowercased form, so
+        find_user() can query directly however often it is called.
+        Identifiers that can't belong to any user (whitespace, several "@",
+        characters usernames never contain) get no key, and find_user()
+        answers None without querying.
+        """
+        identifier = self.cleaned_data["identifier"].strip()
+        if "@" in identifier:
+            if LOGIN_EMAIL_PATTERN.fullmatch(identifier):
+                self._email_digest = generate_email_digest(identifier)
+        elif LOGIN_USERNAME_PATTERN.fullmatch(identifier):
+            self._username_lower = identifier.lower()
+        return identifier
 
     def get_identifier(self) -> str:
         """Get submitted username or email."""
@@ -210,27 +363,47 @@ class LoginForm(forms.Form):
         - If identifier contains @: Search by email (using digest)
         - Otherwise: Search by username
         - Case-insensitive search
+        - Lookup keys come from clean_identifier(), so repeat calls
+          don't re-hash or re-lowercase the identifier
 
         Note: Email search uses email_digest field since emails are encrypted.
         The digest is deterministic (same email -> same digest) so lookups work.
+
+        Only LOGIN_USER_FIELDS are loaded; the email columns (including the
+        encrypted_email blob) are fetched lazily if something reads them.
         """
         if not self.is_valid():
             return None
 
-        identifier = self.get_identifier()
-        user: Optional[User]
+        users = User.objects.only(*LOGIN_USER_FIELDS)
 
-        if "@" in identifier:
+        if self._email_digest is not None:
             # Search by email using digest (for encrypted emails)
-            email_digest = generate_email_digest(identifier)
-            user = User.objects.filter(email_digest=email_digest).first()
-        else:
-            # Search by username
-            user = User.objects.filter(username__iexact=identifier).first()
+            return users.filter(email_digest=self._email_digest).first()
+
+        if self._username_lower is not None:
+            # Search by username (indexed lowercase column, no iexact scan)
+            return users.filter(username_lower=self._username_lower).first()
 
-        return user
+        # Malformed identifier (see clean_identifier): no user can match
+        return None
 
 
+def _dashboard_styled(form_cls):
+    """
+    Class decorator: add the "dashboard-input" CSS class to every field.
+
+    Runs once when the form class is defined, on base_fields. Each form
+    instance deep-copies base_fields, so instances inherit the class
+    without per-request string work in __init__.
+    """
+    for field in form_cls.base_fields.values():
+        classes = field.widget.attrs.get("class", "")
+        field.widget.attrs["class"] = f"dashboard-input {classes}".strip()
+    return form_cls
+
+
+@_dashboard_styled
 class ProfileForm(forms.ModelForm):
     """
     Edit user profile information.
@@ -254,14 +427,8 @@ class ProfileForm(forms.ModelForm):
             "bio": forms.Textarea(attrs={"rows": 3, "placeholder": "Share a short note for our baristas."}),
         }
 
-    def __init__(self, *args, **kwargs):
-        """Add CSS classes to form fields."""
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            classes = field.widget.attrs.get("class", "")
-            field.widget.attrs["class"] = f"dashboard-input {classes}".strip()
-
 
+@_dashboard_styled
 class ChangeUsernameForm(forms.Form):
     """
     Change username with password confirmation.
@@ -287,10 +454,6 @@ class ChangeUsernameForm(forms.Form):
         """Store user for validation."""
         self.user = user
         super().__init__(*args, **kwargs)
-        # Add CSS classes
-        for field in self.fields.values():
-            classes = field.widget.attrs.get("class", "")
-            field.widget.attrs["class"] = f"dashboard-input {classes}".strip()
 
     def clean_new_username(self) -> str:
         """
@@ -303,7 +466,7 @@ class ChangeUsernameForm(forms.Form):
         """
         username = self.cleaned_data["new_username"].strip()
         
-        if not USERNAME_PATTERN.match(username):
+        if not USERNAME_PATTERN.fullmatch(username):
             raise ValidationError(
                 "Username must be 3-30 characters using letters, numbers, periods, underscores, or hyphens."
             )
@@ -311,7 +474,7 @@ class ChangeUsernameForm(forms.Form):
         if username.lower() == self.user.username.lower():
             raise ValidationError("This is already your current username.")
         
-        if User.objects.filter(username__iexact=username).exclude(pk=self.user.pk).exists():
+        if User.objects.filter(username_lower=username.lower()).exclude(pk=self.user.pk).exists():
             raise ValidationError("That username is already taken.")
         
         return username
@@ -325,7 +488,29 @@ class ChangeUsernameForm(forms.Form):
         
         return password
 
+    def save(self) -> bool:
+        """
+        Rename the user.
 
+        clean_new_username() already checked the name is free, but another
+        user can take it before our UPDATE. The unique username_lower
+        constraint catches that; the IntegrityError becomes the usual field
+        error, the user keeps their old name and False is returned.
+        """
+        old_username = self.user.username
+        self.user.username = self.cleaned_data["new_username"]
+        try:
+            with transaction.atomic():
+                self.user.save(update_fields=["username"])
+        except IntegrityError:
+            self.user.username = old_username
+            self.user.username_lower = old_username.lower()
+            self.add_error("new_username", "That username is already taken.")
+            return False
+        return True
+
+
+@_dashboard_styled
 class ChangePasswordForm(forms.Form):
     """
     Change password with validation.
@@ -356,10 +541,6 @@ class ChangePasswordForm(forms.Form):
         """Store user for validation."""
         self.user = user
         super().__init__(*args, **kwargs)
-        # Add CSS classes
-        for field in self.fields.values():
-            classes = field.widget.attrs.get("class", "")
-            field.widget.attrs["class"] = f"dashboard-input {classes}".strip()
 
     def clean_current_password(self) -> str:
         """Verify current password is correct."""
@@ -381,11 +562,8 @@ class ChangePasswordForm(forms.Form):
         password = self.cleaned_data.get("new_password", "")
         
         if password:
-            # Django validators
-            try:
-                password_validation.validate_password(password, self.user)
-            except ValidationError as exc:
-                raise exc
+            # Django validators (ValidationError propagates to the field)
+            password_validation.validate_password(password, self.user)
             
             # Custom strength requirements
             validate_password_strength(password)
@@ -0,0 +1,63 @@
+"""
+Management command to verify email encryption is configured correctly.
+
+Encrypts, hashes and decrypts a sample email with the configured
+ACCOUNT_EMAIL_ENCRYPTION_KEY. Useful for:
+- Verifying the encryption key is correctly configured
+- Demonstrating encryption/decryption for MCO 1
+- Debugging encryption issues
+
+Usage:
+    python manage.py check_email_encryption
+    python manage.py check_email_encryption --email someone@example.com
+"""
+
+import base64
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.encryption import (
+    EmailEncryptionError,
+    decrypt_email,
+    encrypt_email,
+    generate_email_digest,
+)
+
+
+class Command(BaseCommand):
+    help = "Run an encrypt/decrypt roundtrip on a sample email to verify the encryption key."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--email",
+            default="test@example.com",
+            help="Sample email address (default: test@example.com)",
+        )
+
+    def handle(self, *args, **options):
+        email = options["email"]
+
+        self.stdout.write("=== Email Encryption Test ===")
+        self.stdout.write(f"Original email: {email}")
+
+        try:
+            # Encrypt
+            encrypted = encrypt_email(email)
+            self.stdout.write(f"Encrypted (base64): {base64.b64encode(encrypted).decode()[:50]}...")
+            self.stdout.write(f"Encrypted size: {len(encrypted)} bytes")
+
+            # Generate digest
+            digest = generate_email_digest(email)
+            self.stdout.write(f"SHA-256 digest: {digest}")
+
+            # Decrypt
+            decrypted = decrypt_email(encrypted)
+            self.stdout.write(f"Decrypted email: {decrypted}")
+        except EmailEncryptionError as e:
+            raise CommandError(f"Encryption test failed: {e}")
+
+        # Verify
+        if decrypted != email.strip().lower():
+            raise CommandError("Roundtrip failed: decrypted email does not match the original")
+
+        self.stdout.write(self.style.SUCCESS("Roundtrip successful"))
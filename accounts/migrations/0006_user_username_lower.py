@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:38
+
+"""
+Add username_lower for case-insensitive username lookups.
+
+This migration:
+1. Adds the indexed username_lower column
+2. Fills it from username for existing users
+
+New and renamed users are kept in sync by User.save().
+"""
+
+from django.db import migrations, models
+
+
+def populate_username_lower(apps, schema_editor):
+    """Copy each existing username into username_lower, lowercased."""
+    User = apps.get_model("accounts", "User")
+
+    users = list(User.objects.only("pk", "username"))
+    for user in users:
+        user.username_lower = user.username.lower()
+
+    User.objects.bulk_update(users, ["username_lower"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_alter_user_managers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="username_lower",
+            field=models.CharField(
+                db_index=True,
+                default="",
+                editable=False,
+                help_text="Lowercased username for case-insensitive lookups",
+                max_length=150,
+            ),
+        ),
+        migrations.RunPython(
+            populate_username_lower,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:44
+
+"""
+Make username_lower unique.
+
+This migration:
+1. Refuses to run if two usernames differ only in case ("Alice"/"alice").
+   Before this, only the signup form checked username__iexact, so
+   createsuperuser and create_user() could register both; rename one of
+   them and re-run migrate
+2. Makes username_lower unique and nullable, so rows inserted without
+   User.save() (e.g. a plain bulk_create) don't all collide on ""
+"""
+
+from django.db import migrations, models
+
+
+def check_case_duplicate_usernames(apps, schema_editor):
+    """Fail with the clashing usernames instead of a bare IntegrityError."""
+    User = apps.get_model("accounts", "User")
+
+    duplicates = (
+        User.objects.values("username_lower")
+        .annotate(count=models.Count("pk"))
+        .filter(count__gt=1)
+        .values_list("username_lower", flat=True)
+    )
+    clashes = []
+    for username_lower in duplicates:
+        usernames = User.objects.filter(username_lower=username_lower).values_list(
+            "username", flat=True
+        )
+        clashes.append(", ".join(sorted(usernames)))
+
+    if clashes:
+        raise RuntimeError(
+            "Cannot make username_lower unique: these usernames differ only "
+            "in case. Rename all but one in each group, then run migrate "
+            "again.\n" + "\n".join(f"  - {clash}" for clash in clashes)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_user_username_lower"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_duplicate_usernames,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="username_lower",
+            field=models.CharField(
+                editable=False,
+                help_text="Lowercased username for case-insensitive lookups",
+                max_length=150,
+                null=True,
+                unique=True,
+            ),
+        ),
+    ]
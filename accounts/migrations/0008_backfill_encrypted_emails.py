@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-16 21:02
+
+"""
+Encrypt any plaintext emails that are still missing their encrypted copy.
+
+Runs before 0009 drops the plaintext email column, so no address is lost.
+Rows written by User.save() since 0003 already have encrypted_email and
+email_digest and are left untouched.
+
+This migration:
+1. Streams users with an email but no encrypted_email/email_digest
+   in batches of BATCH_SIZE (iterator(chunk_size=...))
+2. Encrypts each email and generates its digest
+3. Writes each batch back with one bulk_update()
+"""
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_encrypted_emails(apps, schema_editor):
+    """Fill encrypted_email/email_digest from the plaintext email column."""
+    from accounts.encryption import encrypt_email, generate_email_digest, normalize_email_bytes
+
+    User = apps.get_model("accounts", "User")
+
+    pending = (
+        User.objects.exclude(email="")
+        .filter(models.Q(encrypted_email__isnull=True) | models.Q(email_digest__isnull=True))
+        .only("pk", "email")
+        .order_by("pk")
+    )
+
+    batch = []
+    for user in pending.iterator(chunk_size=BATCH_SIZE):
+        email_bytes = normalize_email_bytes(user.email)
+        user.encrypted_email = encrypt_email(email_bytes)
+        user.email_digest = generate_email_digest(email_bytes)
+        batch.append(user)
+        if len(batch) == BATCH_SIZE:
+            User.objects.bulk_update(batch, ["encrypted_email", "email_digest"])
+            batch = []
+
+    if batch:
+        User.objects.bulk_update(batch, ["encrypted_email", "email_digest"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_alter_user_username_lower"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_encrypted_emails,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
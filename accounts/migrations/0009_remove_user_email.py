@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-16 21:03
+
+"""
+Drop the plaintext email column.
+
+Emails now live only in encrypted_email (AES-256-GCM) and email_digest
+(SHA-256); User.email is a property that decrypts on access. 0008 has
+already encrypted every remaining plaintext address.
+
+Reversing re-adds an empty column; the plaintext is not restored.
+"""
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_backfill_encrypted_emails"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="user",
+            name="email",
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-16 21:07
+
+"""
+Add display_name_cached, a copy of profile.display_name on the user row.
+
+This migration:
+1. Adds the display_name_cached column
+2. Fills it from each user's profile (one UPDATE with a subquery)
+
+Profile.save() keeps it in sync afterwards.
+"""
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_display_name_cached(apps, schema_editor):
+    """Copy each profile's display_name onto its user."""
+    User = apps.get_model("accounts", "User")
+    Profile = apps.get_model("accounts", "Profile")
+
+    display_name = Profile.objects.filter(user=models.OuterRef("pk")).values("display_name")[:1]
+    User.objects.update(
+        display_name_cached=Coalesce(models.Subquery(display_name), models.Value(""))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_remove_user_email"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="display_name_cached",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Copy of profile.display_name",
+                max_length=120,
+            ),
+        ),
+        migrations.RunPython(
+            populate_display_name_cached,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -10,64 +10,153 @@ Models:
 Security Features (MCO 1):
 - AES-256-GCM email encryption for PII protection
 - SHA-256 email digest for lookups and uniqueness
-- Transparent encryption/decryption on save/access
+- Transparent encryption/decryption on assignment/access (user.email)
 """
 
 import logging
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.db import models
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 from .encryption import (
+    encrypt_and_digest,
     encrypt_email,
+    encrypt_emails,
     decrypt_email,
     generate_email_digest,
+    generate_email_digests,
+    normalize_email_bytes,
     DecryptionFailedError,
     EmailEncryptionError,
 )
 
 logger = logging.getLogger(__name__)
 
+# How long (seconds) a username/email uniqueness answer may be reused.
+# Saves and deletes clear the affected keys in this process; other worker
+# processes (per-process LocMemCache) may keep a stale answer this long.
+UNIQUENESS_CACHE_TIMEOUT = 30
+
+# Default rows per INSERT for UserManager.bulk_create_users()
+BULK_CREATE_BATCH_SIZE = 500
+
+
+def _username_taken_cache_key(username_lower: str) -> str:
+    return f"accounts:username_taken:{username_lower}"
+
+
+def _email_taken_cache_key(email_digest: str) -> str:
+    return f"accounts:email_taken:{email_digest}"
+
+
+# True while suppress_profile_creation() is active (per thread/async task)
+_profile_creation_suppressed: ContextVar[bool] = ContextVar(
+    "profile_creation_suppressed", default=False
+)
+
+
+@contextmanager
+def suppress_profile_creation() -> Iterator[None]:
+    """
+    Stop _ensure_profile from creating profiles inside this block.
+
+    For importers that create users with save() and write their Profile
+    rows themselves (e.g. in one bulk_create()). Every user still needs a
+    profile: the caller is responsible for creating them.
+
+    Example:
+        >>> with suppress_profile_creation():
+        ...     for user in users:
+        ...         user.save()
+        >>> Profile.objects.bulk_create([Profile(user=u) for u in users])
+    """
+    token = _profile_creation_suppressed.set(True)
+    try:
+        yield
+    finally:
+        _profile_creation_suppressed.reset(token)
+
 
 class UserManager(BaseUserManager):
     """Custom manager for user creation with email."""
 
     use_in_migrations = True
 
-    def _create_user(self, username: str, email: str, password: Optional[str], **extra_fields):
+    def get_queryset(self):
+        """
+        Defer the encrypted_email blob on every query through User.objects.
+
+        The session user is loaded on every authenticated request and
+        almost never needs the ciphertext. Reading user.email (or
+        user.encrypted_email) still works: Django loads the deferred column
+        on first access.
+        """
+        return super().get_queryset().defer("encrypted_email")
+
+    def _create_user(self, username: str, email: Optional[str], password: Optional[str], **extra_fields):
         """
         Create and save a user with hashed password.
         
         Process:
-        1. Validate username and email
+        1. Validate username
         2. Normalize email (lowercase)
-        3. Hash password with Argon2
-        4. Save to database
+        3. Encrypt email (reusing a precomputed digest if given)
+        4. Hash password with Argon2
+        5. Save to database, together with the Profile created by the
+           post_save signal, in one transaction (no user without a profile)
+
+        Callers that already hashed the email (e.g. SignupForm's uniqueness
+        check) can pass email_digest=generate_email_digest(email) to skip
+        computing it a second time.
+        """
+        user = self._build_user(username, email, password, **extra_fields)
+        self._save_new_user(user)
+        return user
+
+    def _build_user(self, username: str, email: Optional[str], password: Optional[str], **extra_fields):
+        """
+        Steps 1-4 of _create_user(): an unsaved user with encrypted email
+        and hashed password. Pure CPU work (AES-GCM, SHA-256, Argon2), no
+        database access, so acreate_user() can run it on a worker thread.
         """
         if not username:
             raise ValueError("The username must be set")
-        if not email:
-            raise ValueError("The email must be set")
 
-        email = self.normalize_email(email)
-        user = self.model(username=username, email=email, **extra_fields)
+        email_digest = extra_fields.pop("email_digest", None)
+        username = self.model.normalize_username(username)
+        user = self.model(username=username, **extra_fields)
+        if email:
+            user._encrypt_and_store_email(self.normalize_email(email), email_digest=email_digest)
         user.set_password(password)  # Hashes password with Argon2
-        user.save(using=self._db)
         return user
 
+    def _save_new_user(self, user: "User") -> None:
+        """Step 5 of _create_user(): insert the user and its profile atomically."""
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)  # _ensure_profile runs inside this block
+
     def create_user(self, username: str, email: str, password: Optional[str] = None, **extra_fields):
-        """Create regular user (not staff)."""
+        """Create regular user (not staff). Regular users must have an email."""
+        if not email:
+            raise ValueError("The email must be set")
         extra_fields.setdefault("is_staff", False)
         extra_fields.setdefault("is_superuser", False)
         return self._create_user(username, email, password, **extra_fields)
 
-    def create_superuser(self, username: str, email: str, password: Optional[str] = None, **extra_fields):
-        """Create admin user with all permissions."""
+    def create_superuser(
+        self, username: str, email: Optional[str] = None, password: Optional[str] = None, **extra_fields
+    ):
+        """Create admin user with all permissions (email optional)."""
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
 
@@ -78,6 +167,165 @@ class UserManager(BaseUserManager):
 
         return self._create_user(username, email, password, **extra_fields)
 
+    async def acreate_user(self, username: str, email: str, password: Optional[str] = None, **extra_fields):
+        """
+        Async create_user() for ASGI views.
+
+        Argon2 hashing (~0.3 s) and email encryption run on the default
+        thread pool (sync_to_async(thread_sensitive=False)), so they don't
+        hold the event loop or the single thread Django runs sync database
+        code on. Only the INSERTs go through the thread-sensitive path.
+        """
+        if not email:
+            raise ValueError("The email must be set")
+        extra_fields.setdefault("is_staff", False)
+        extra_fields.setdefault("is_superuser", False)
+        return await self._acreate_user(username, email, password, **extra_fields)
+
+    async def acreate_superuser(
+        self, username: str, email: Optional[str] = None, password: Optional[str] = None, **extra_fields
+    ):
+        """Async create_superuser(); see acreate_user()."""
+        extra_fields.setdefault("is_staff", True)
+        extra_fields.setdefault("is_superuser", True)
+
+        if extra_fields.get("is_staff") is not True:
+            raise ValueError("Superuser must have is_staff=True.")
+        if extra_fields.get("is_superuser") is not True:
+            raise ValueError("Superuser must have is_superuser=True.")
+
+        return await self._acreate_user(username, email, password, **extra_fields)
+
+    async def _acreate_user(self, username: str, email: Optional[str], password: Optional[str], **extra_fields):
+        user = await sync_to_async(self._build_user, thread_sensitive=False)(
+            username, email, password, **extra_fields
+        )
+        await sync_to_async(self._save_new_user)(user)
+        return user
+
+    def bulk_create_users(
+        self, rows: Iterable[Mapping[str, Any]], batch_size: Optional[int] = BULK_CREATE_BATCH_SIZE
+    ) -> List["User"]:
+        """
+        Create many users at once (imports, fixtures, admin provisioning).
+
+        Each row needs "username", "email" and "password"; other keys are
+        passed to User() as extra fields. Unlike a create_user() loop:
+        - Emails are normalized once, then encrypted and hashed as batches
+          (encrypt_emails / generate_email_digests)
+        - Users and their profiles are inserted with bulk_create()
+
+        bulk_create() skips save() and post_save, so this method does their
+        work itself: username_lower, display_name_cached, Profile rows and
+        uniqueness cache invalidation. Everything runs in one transaction.
+
+        Args:
+            rows: One mapping per user
+            batch_size: Rows per INSERT statement (None = all at once; keeps
+                large imports under the database's bind-parameter limit)
+
+        Returns:
+            list[User]: The created users, in input order
+
+        Raises:
+            ValueError: A row has an empty username or email (nothing is
+                encrypted or inserted)
+        """
+        rows = list(rows)
+        # Same checks as _build_user()/create_user(), before any encryption
+        for row in rows:
+            if not row.get("username"):
+                raise ValueError("The username must be set")
+            if not row.get("email"):
+                raise ValueError("The email must be set")
+
+        email_bytes = [normalize_email_bytes(row["email"]) for row in rows]
+        encrypted = encrypt_emails(email_bytes)
+        digests = generate_email_digests(email_bytes)
+
+        users = []
+        for row, email, ciphertext, digest in zip(rows, email_bytes, encrypted, digests):
+            extra_fields = {
+                key: value for key, value in row.items()
+                if key not in ("username", "email", "password")
+            }
+            username = self.model.normalize_username(row["username"])
+            user = self.model(
+                username=username,
+                username_lower=username.lower(),
+                display_name_cached=username,
+                encrypted_email=ciphertext,
+                email_digest=digest,
+                password=make_password(row["password"]),
+                **extra_fields,
+            )
+            # Same state _encrypt_and_store_email() leaves behind
+            user._email_cache = email.decode("utf-8")
+            users.append(user)
+
+        with transaction.atomic(using=self._db):
+            users = self.bulk_create(users, batch_size=batch_size)
+            Profile.objects.db_manager(self._db).bulk_create(
+                [Profile(user=user, display_name=user.username) for user in users],
+                batch_size=batch_size,
+            )
+
+        cache_keys = []
+        for user in users:
+            cache_keys.append(_username_taken_cache_key(user.username_lower))
+            cache_keys.append(_email_taken_cache_key(user.email_digest))
+        cache.delete_many(cache_keys)
+
+        return users
+
+    def registration_conflicts(
+        self, username: str, email_digest: str, *, refresh: bool = False
+    ) -> Tuple[bool, bool]:
+        """
+        Check username and email uniqueness for a signup in one query.
+
+        Each answer is cached for UNIQUENESS_CACHE_TIMEOUT seconds so retried
+        signups (typos, bots) skip the database; saving or deleting a user
+        clears its keys (see _clear_uniqueness_cache). Whatever is not
+        cached is fetched with a single
+        filter(Q(username_lower=...) | Q(email_digest=...)) instead of one
+        exists() per field. Takes the email digest so callers that already
+        computed it don't hash twice.
+
+        Args:
+            refresh: Ignore cached answers and re-query (used after an
+                INSERT lost a race, when a cached "free" may be stale)
+
+        Returns:
+            (username_taken, email_taken)
+        """
+        username_lower = username.lower()
+        username_key = _username_taken_cache_key(username_lower)
+        email_key = _email_taken_cache_key(email_digest)
+
+        cached = {} if refresh else cache.get_many([username_key, email_key])
+        username_taken = cached.get(username_key)
+        email_taken = cached.get(email_key)
+
+        if username_taken is None or email_taken is None:
+            query = models.Q()
+            if username_taken is None:
+                query |= models.Q(username_lower=username_lower)
+            if email_taken is None:
+                query |= models.Q(email_digest=email_digest)
+
+            hits = set(self.filter(query).values_list("username_lower", "email_digest"))
+            found = {}
+            if username_taken is None:
+                username_taken = any(u == username_lower for u, _ in hits)
+                found[username_key] = username_taken
+            if email_taken is None:
+                email_taken = any(d == email_digest for _, d in hits)
+                found[email_key] = email_taken
+            cache.set_many(found, UNIQUENESS_CACHE_TIMEOUT)
+
+        return username_taken, email_taken
+
 
 class User(AbstractUser):
     """
@@ -88,20 +336,28 @@ class User(AbstractUser):
     - SHA-256 email digest for lookups
 
     Email Encryption (MCO 1 Academic Project):
-    - email: Plaintext field (kept for backwards compatibility, will be deprecated)
+    - email: Python property, not a column (the plaintext column was dropped
+      in migration 0008); reading decrypts, assigning encrypts
     - encrypted_email: AES-256-GCM encrypted email (BinaryField)
     - email_digest: SHA-256 hash for lookups and uniqueness (CharField)
 
+    Username lookups:
+    - username_lower: Lowercased copy of username, unique and indexed for
+      case-insensitive checks without UPPER()/LIKE scans
+
+    Denormalized profile data:
+    - display_name_cached: Copy of profile.display_name so page headers
+      don't query the Profile table (kept in sync by Profile.save())
+
     How it works:
-    1. On save(): email is encrypted -> encrypted_email, digest generated -> email_digest
-    2. On access: user.email_decrypted returns decrypted email (cached in memory)
-    3. For lookups: Use email_digest (e.g., User.objects.get(email_digest=digest))
+    1. On assignment (user.email = ...): email is encrypted -> encrypted_email,
+       digest generated -> email_digest
+    2. On save(): username copied -> username_lower
+    3. On access: user.email / user.email_decrypted returns decrypted email
+       (cached in memory)
+    4. For lookups: Use email_digest (e.g., User.objects.get(email_digest=digest))
     """
 
-    # Email fields (plaintext for backwards compatibility during migration)
-    # TODO: Remove this field after full migration to encrypted_email
-    email = models.EmailField(unique=False, blank=True)  # unique=False to avoid conflicts with digest
-
     # Encrypted email storage (AES-256-GCM)
     # Format: [12 bytes nonce][variable length ciphertext + auth_tag]
     encrypted_email = models.BinaryField(blank=True, null=True)
@@ -117,42 +373,78 @@ class User(AbstractUser):
         help_text="SHA-256 digest of email for lookups"
     )
 
+    # Lowercased username for case-insensitive lookups (maintained by save())
+    # Plain equality on an indexed column instead of username__iexact;
+    # unique so "Alice" and "alice" cannot both be registered; nullable so
+    # rows inserted without save() don't all collide on ""
+    username_lower = models.CharField(
+        max_length=150,
+        unique=True,
+        null=True,
+        editable=False,
+        help_text="Lowercased username for case-insensitive lookups"
+    )
+
+    # Copy of Profile.display_name for page headers (maintained by
+    # Profile.save()); saves the profile query on every dashboard render
+    display_name_cached = models.CharField(
+        max_length=120,
+        blank=True,
+        editable=False,
+        help_text="Copy of profile.display_name"
+    )
+
+    # EMAIL_FIELD names the email property below; Django's tooling
+    # (password validators, reset tokens) reads it with getattr()
     EMAIL_FIELD = 'email'
-    REQUIRED_FIELDS = ['email']
+    # createsuperuser prompts for every REQUIRED_FIELDS entry as a model
+    # field, and email is no longer one (create_user() still requires it)
+    REQUIRED_FIELDS = []
+
+    objects = UserManager()
 
     # Cache for decrypted email (avoid repeated decryption)
     _email_cache: Optional[str] = None
 
     # ===== Email Encryption Methods (MCO 1) =====
 
-    def _encrypt_and_store_email(self, plaintext_email: str) -> None:
+    def _encrypt_and_store_email(
+        self, plaintext_email: Union[str, bytes], email_digest: Optional[str] = None
+    ) -> None:
         """
         Encrypt email and generate digest for storage.
 
         This method:
         1. Encrypts the email using AES-256-GCM
-        2. Generates SHA-256 digest for lookups
+        2. Generates SHA-256 digest for lookups (unless one is supplied)
+           in the same call (encrypt_and_digest)
         3. Stores both in database fields
 
-        Called automatically by save() method.
+        Called by the email setter and UserManager.create_user().
 
         Args:
-            plaintext_email: Email address to encrypt
+            plaintext_email: Email address to encrypt (or normalize_email_bytes() output)
+            email_digest: Precomputed generate_email_digest(plaintext_email)
 
         Raises:
             EmailEncryptionError: If encryption fails
         """
         try:
-            # Encrypt email using AES-256-GCM
-            self.encrypted_email = encrypt_email(plaintext_email)
+            # Normalize once; both encryption and digest use the same bytes
+            email_bytes = normalize_email_bytes(plaintext_email)
 
-            # Generate digest for lookups and uniqueness
-            self.email_digest = generate_email_digest(plaintext_email)
+            # Encrypt email using AES-256-GCM, and generate the digest for
+            # lookups and uniqueness unless the caller already has it
+            if email_digest:
+                self.encrypted_email = encrypt_email(email_bytes)
+                self.email_digest = email_digest
+            else:
+                self.encrypted_email, self.email_digest = encrypt_and_digest(email_bytes)
 
             # Keep plaintext in cache for immediate access
-            self._email_cache = plaintext_email.lower().strip()
+            self._email_cache = email_bytes.decode('utf-8')
 
-            logger.debug(f"Encrypted email for user {self.username}")
+            logger.debug("Encrypted email for user %s", self.username)
 
         except EmailEncryptionError as e:
             logger.error(f"Failed to encrypt email for user {self.username}: {e}")
@@ -166,7 +458,7 @@ class User(AbstractUser):
         This property provides transparent access to the encrypted email:
         - First access: Decrypts from encrypted_email and caches result
         - Subsequent accesses: Returns cached value (no decryption needed)
-        - Falls back to plaintext email field if encrypted_email not set
+        - Returns "" if the user has no email (e.g. superusers)
 
         Returns:
             str: Decrypted email address
@@ -177,7 +469,8 @@ class User(AbstractUser):
             >>> email2 = user.email_decrypted  # Uses cache
 
         Note:
-            Cache is cleared when object is reloaded from database.
+            Cache is cleared by refresh_from_db() and when a new email is
+            assigned; a fresh query returns a fresh instance.
         """
         # Return cached value if available
         if self._email_cache:
@@ -190,19 +483,62 @@ class User(AbstractUser):
                 return self._email_cache
             except DecryptionFailedError as e:
                 logger.error(f"Failed to decrypt email for user {self.username}: {e}")
-                # Fall through to plaintext fallback
-
-        # Fallback to plaintext email (backwards compatibility)
-        if self.email:
-            logger.warning(
-                f"Using plaintext email for user {self.username} "
-                "(encrypted_email not available)"
-            )
-            return self.email
 
         # No email available
         return ""
 
+    @property
+    def email(self) -> str:
+        """
+        The user's email address, decrypted on demand.
+
+        There is no plaintext email column; this is an alias for
+        email_decrypted so user.email keeps working in views, templates
+        and Django's auth tooling.
+        """
+        return self.email_decrypted
+
+    @email.setter
+    def email(self, value: Optional[str]) -> None:
+        """
+        Encrypt a new email into encrypted_email/email_digest.
+
+        Also runs for User(email=...) since Django assigns property kwargs.
+        Re-assigning the address the user already has (as AbstractUser.clean()
+        does) is a no-op: it matches the decrypted cache or, for a user
+        loaded without decrypting, the stored email_digest. Either way no
+        new ciphertext (and nonce) is written. An empty value clears the
+        stored email.
+        """
+        if not value:
+            self.encrypted_email = None
+            self.email_digest = None
+            self._email_cache = None
+            return
+
+        email_bytes = normalize_email_bytes(value)
+        normalized = email_bytes.decode("utf-8")
+        if normalized == self._email_cache:
+            return
+
+        digest = generate_email_digest(email_bytes)
+        if digest == self.email_digest:
+            self._email_cache = normalized
+            return
+        self._encrypt_and_store_email(email_bytes, email_digest=digest)
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """
+        Reload from the database, dropping the decrypted email if it may be stale.
+
+        The email is only forgotten when encrypted_email is reloaded
+        (fields=None or a list naming it), so refreshing e.g. last_login
+        keeps the cached plaintext.
+        """
+        if fields is None or "encrypted_email" in fields:
+            self._email_cache = None
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+
     @staticmethod
     def find_by_email(email: str):
         """
@@ -231,25 +567,43 @@ class User(AbstractUser):
 
     def save(self, *args, **kwargs):
         """
-        Override save to automatically encrypt email before storing.
+        Override save to keep derived columns in sync.
 
-        This ensures email is always encrypted when saving to database:
-        1. Check if email field has a value
-        2. If yes, encrypt it and generate digest
-        3. Save to database
+        Email encryption already happened when the email was assigned (see
+        the email setter), so save() never runs AES-GCM or SHA-256 and the
+        row carries the ciphertext and digest only, no plaintext copy.
 
-        The encryption happens transparently - callers don't need to
-        manually call encryption methods.
+        What save() does:
+        1. Map update_fields=["email"] to the columns that store it
+           (encrypted_email, email_digest)
+        2. Refresh username_lower from username
+        3. Save to database
 
         Example:
-            >>> user = User(username="bob", email="bob@example.com")
-            >>> user.save()  # Email automatically encrypted
+            >>> user = User(username="bob", email="bob@example.com")  # Encrypted here
+            >>> user.save()
             >>> user.encrypted_email  # Contains encrypted bytes
             b'\\x...'
         """
-        # If email is set, encrypt it before saving
-        if self.email:
-            self._encrypt_and_store_email(self.email)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "email" in update_fields:
+            update_fields = {*update_fields, "encrypted_email", "email_digest"} - {"email"}
+            kwargs["update_fields"] = update_fields
+
+        # New users get the display name their profile will be created with
+        # (see _ensure_profile), so creating the profile needs no UPDATE
+        if self._state.adding and not self.display_name_cached:
+            self.display_name_cached = self.username
+
+        # Keep the case-insensitive lookup column in sync with username,
+        # including partial saves like save(update_fields=["username"]).
+        # A rename frees the old name; _clear_uniqueness_cache drops its key
+        previous = self.__dict__.get("username_lower")  # no query if deferred
+        if previous and previous != self.username.lower():
+            self._freed_username_lower = previous
+        self.username_lower = self.username.lower()
+        if update_fields is not None and "username" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "username_lower"}
 
         # Call parent save method
         super().save(*args, **kwargs)
@@ -342,9 +696,35 @@ class Profile(models.Model):
     def __str__(self) -> str:
         return f"Profile for {self.user.username}"
 
+    def save(self, *args, **kwargs):
+        """
+        Save the profile and copy display_name to user.display_name_cached.
+
+        The copy is written with queryset.update() (no User signals) and
+        only when it differs: if the profile's user is already loaded and
+        up to date (e.g. the profile created at signup), no query is made.
+        A loaded user object is updated in memory too, so the page rendered
+        after a profile edit shows the new name.
+        """
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "display_name" not in update_fields:
+            return
+
+        user = self.user if Profile.user.is_cached(self) else None
+        if user is not None:
+            if user.display_name_cached == self.display_name:
+                return
+            user.display_name_cached = self.display_name
+
+        User.objects.filter(pk=self.user_id).exclude(
+            display_name_cached=self.display_name
+        ).update(display_name_cached=self.display_name)
+
 
 @receiver(post_save, sender=User)
-def _ensure_profile(sender, instance: User, created: bool, **kwargs) -> None:
+def _ensure_profile(sender, instance: User, created: bool, raw: bool = False, **kwargs) -> None:
     """
     Signal: Auto-create profile when user is created.
     
@@ -355,6 +735,35 @@ def _ensure_profile(sender, instance: User, created: bool, **kwargs) -> None:
     4. Creates Profile with display_name = username
     
     Why: Ensures every user always has a profile
+
+    Skipped when:
+    - raw=True: loaddata is saving a fixture row; the fixture carries its
+      own Profile rows (creating one here would collide with them)
+    - Inside suppress_profile_creation(): the caller creates profiles
+    """
+    if raw or not created or _profile_creation_suppressed.get():
+        return
+    Profile.objects.create(user=instance, display_name=instance.username)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _clear_uniqueness_cache(sender, instance: User, **kwargs) -> None:
+    """
+    Signal: Drop cached username/email uniqueness answers for this user.
+
+    Keeps UserManager.registration_conflicts() from reporting a
+    just-registered username or email as free (or a deleted or renamed-away
+    one as taken). Partial saves that touch neither column (e.g. the
+    last_login update on every login) have nothing to clear.
     """
-    if created:
-        Profile.objects.create(user=instance, display_name=instance.username)
\ No newline at end of file
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not {"username_lower", "email_digest"} & update_fields:
+        return
+    keys = [_username_taken_cache_key(instance.username_lower)]
+    freed = instance.__dict__.pop("_freed_username_lower", None)
+    if freed:
+        keys.append(_username_taken_cache_key(freed))
+    if instance.email_digest:
+        keys.append(_email_taken_cache_key(instance.email_digest))
+    cache.delete_many(keys)
@@ -3,7 +3,7 @@ Tests for email encryption functionality (MCO 1).
 
 Test Coverage:
 - Encryption/decryption utilities
-- User model encryption on save
+- User model encryption on email assignment
 - Email digest generation and lookups
 - Form validation with encrypted emails
 - Login with encrypted emails
@@ -13,17 +13,31 @@ Test Coverage:
 """
 
 import base64
+from io import StringIO
 from unittest.mock import patch
 
+from django.apps import apps
 from django.contrib.auth import authenticate
-from django.test import TestCase, Client
+from django.core.exceptions import FieldDoesNotExist
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from accounts import encryption
+from accounts.checks import check_email_encryption_key
 from accounts.encryption import (
+    encrypt_and_digest,
     encrypt_email,
+    encrypt_emails,
     decrypt_email,
+    decrypt_emails,
     generate_email_digest,
+    generate_email_digests,
     generate_encryption_key,
+    normalize_email_bytes,
     EmailEncryptionError,
     DecryptionFailedError,
     MissingEncryptionKeyError,
@@ -101,6 +115,46 @@ class EncryptionUtilitiesTestCase(TestCase):
         # But both should decrypt to same value
         self.assertEqual(decrypt_email(encrypted1), decrypt_email(encrypted2))
 
+    def test_encrypt_emails_batch_roundtrip(self):
+        """Test that bulk encryption matches single-email decryption."""
+        emails = ["alice@example.com", "Bob@Example.com", "alice@example.com"]
+
+        encrypted = encrypt_emails(emails)
+
+        self.assertEqual(len(encrypted), 3)
+        self.assertEqual(
+            decrypt_emails(encrypted),
+            ["alice@example.com", "bob@example.com", "alice@example.com"],
+        )
+        self.assertEqual(decrypt_email(encrypted[1]), "bob@example.com")
+        # Every entry gets its own nonce, even for repeated emails
+        self.assertEqual(len({value[:12] for value in encrypted}), 3)
+
+    def test_decrypt_emails_rejects_bad_value(self):
+        """Test that one corrupted value fails the whole batch."""
+        encrypted = encrypt_emails(["alice@example.com", "bob@example.com"])
+
+        with self.assertRaises(DecryptionFailedError):
+            decrypt_emails([encrypted[0], encrypted[1][:-1]])
+        with self.assertRaises(DecryptionFailedError):
+            decrypt_emails([b"short"])
+
+    def test_generate_email_digests_matches_single_digest(self):
+        """Test that batch digests equal per-email digests."""
+        emails = ["alice@example.com", " Bob@Example.com ", normalize_email_bytes("c@d.com")]
+
+        self.assertEqual(
+            generate_email_digests(emails),
+            [generate_email_digest(email) for email in emails],
+        )
+
+    def test_encrypt_and_digest_matches_separate_calls(self):
+        """Test that the combined call equals encrypt_email + generate_email_digest."""
+        encrypted, digest = encrypt_and_digest(" Test@Example.com ")
+
+        self.assertEqual(decrypt_email(encrypted), "test@example.com")
+        self.assertEqual(digest, generate_email_digest("test@example.com"))
+
     def test_generate_email_digest(self):
         """Test SHA-256 digest generation."""
         email = "test@example.com"
@@ -133,6 +187,14 @@ class EncryptionUtilitiesTestCase(TestCase):
         # All should be the same
         self.assertEqual(len(set(digests)), 1)
 
+    def test_normalized_bytes_accepted_by_encrypt_and_digest(self):
+        """Test that pre-normalized bytes give the same results as the string."""
+        email_bytes = normalize_email_bytes("  Test@Example.COM ")
+
+        self.assertEqual(email_bytes, b"test@example.com")
+        self.assertEqual(generate_email_digest(email_bytes), generate_email_digest("test@example.com"))
+        self.assertEqual(decrypt_email(encrypt_email(email_bytes)), "test@example.com")
+
     def test_decrypt_invalid_data_raises_error(self):
         """Test that decrypting invalid data raises DecryptionFailedError."""
         invalid_data = b"not valid encrypted data"
@@ -152,6 +214,89 @@ class EncryptionUtilitiesTestCase(TestCase):
         with self.assertRaises(DecryptionFailedError):
             decrypt_email(short_data)
 
+    def test_check_email_encryption_command(self):
+        """Test that the roundtrip management command reports success."""
+        out = StringIO()
+
+        call_command("check_email_encryption", "--email", "Test@Example.com", stdout=out)
+
+        self.assertIn("Roundtrip successful", out.getvalue())
+
+    def test_cipher_is_built_once_and_reused(self):
+        """Test that the AESGCM cipher is cached between calls."""
+        encryption._reset_cipher_cache()
+
+        with patch('accounts.encryption.get_encryption_key',
+                   wraps=encryption.get_encryption_key) as mock_key:
+            encrypted = encrypt_email("test@example.com")
+            decrypt_email(encrypted)
+            encrypt_email("other@example.com")
+
+            self.assertEqual(mock_key.call_count, 1)
+
+    def test_app_ready_builds_cipher(self):
+        """Test that AccountsConfig.ready() builds the cipher ahead of first use."""
+        encryption._reset_cipher_cache()
+
+        apps.get_app_config("accounts").ready()
+
+        self.assertIsNotNone(encryption._AESGCM_SINGLETON)
+
+    def test_app_ready_defers_invalid_key(self):
+        """Test that a bad key doesn't abort app loading but is reported by the check."""
+        try:
+            with override_settings(ACCOUNT_EMAIL_ENCRYPTION_KEY="not-a-valid-key"):
+                with self.assertLogs("accounts.apps", level="WARNING"):
+                    apps.get_app_config("accounts").ready()
+                self.assertIsNone(encryption._AESGCM_SINGLETON)
+
+                errors = check_email_encryption_key(None)
+                self.assertEqual([error.id for error in errors], ["accounts.W001"])
+        finally:
+            encryption._reset_cipher_cache()
+
+        self.assertEqual(check_email_encryption_key(None), [])
+
+    def test_reset_cipher_cache_picks_up_new_key(self):
+        """Test that resetting the cache rebuilds the cipher from settings."""
+        encrypted = encrypt_email("test@example.com")
+
+        try:
+            with override_settings(ACCOUNT_EMAIL_ENCRYPTION_KEY=generate_encryption_key()):
+                encryption._reset_cipher_cache()
+                with self.assertRaises(DecryptionFailedError):
+                    decrypt_email(encrypted)
+        finally:
+            encryption._reset_cipher_cache()
+
+        self.assertEqual(decrypt_email(encrypted), "test@example.com")
+
+    def test_key_setting_change_resets_cipher(self):
+        """Test that override_settings() on the key rebuilds the cipher both ways."""
+        encrypted = encrypt_email("test@example.com")
+
+        with override_settings(ACCOUNT_EMAIL_ENCRYPTION_KEY=generate_encryption_key()):
+            with self.assertRaises(DecryptionFailedError):
+                decrypt_email(encrypted)
+
+        self.assertEqual(decrypt_email(encrypted), "test@example.com")
+
+    def test_decrypt_email_memoizes_per_ciphertext(self):
+        """Test that the same ciphertext (bytes or memoryview) is decrypted once."""
+        encrypted = encrypt_email("test@example.com")
+        encryption._reset_cipher_cache()
+
+        with patch('accounts.encryption._get_cipher',
+                   wraps=encryption._get_cipher) as mock_cipher:
+            self.assertEqual(decrypt_email(encrypted), "test@example.com")
+            self.assertEqual(decrypt_email(memoryview(encrypted)), "test@example.com")
+
+            self.assertEqual(mock_cipher.call_count, 1)
+
+        # A key reset must also drop decrypted plaintexts (see test above)
+        encryption._reset_cipher_cache()
+        self.assertEqual(encryption._decrypt_email_cached.cache_info().currsize, 0)
+
 
 class UserModelEncryptionTestCase(TestCase):
     """Test User model encryption functionality."""
@@ -211,6 +356,149 @@ class UserModelEncryptionTestCase(TestCase):
 
             self.assertEqual(email1, email2)
 
+    def test_refresh_from_db_drops_stale_decrypted_email(self):
+        """Test that refresh_from_db() forgets a decrypted email changed elsewhere."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="old@example.com",
+            password="TestPassword123!"
+        )
+        other = User.objects.get(pk=user.pk)
+        other.email = "new@example.com"
+        other.save()
+
+        user.refresh_from_db(fields=["last_login"])
+        self.assertEqual(user.email, "old@example.com")  # encrypted_email not reloaded
+
+        user.refresh_from_db()
+        self.assertEqual(user.email, "new@example.com")
+
+    def test_assigning_stored_email_to_loaded_user_skips_encryption(self):
+        """Test that re-assigning the stored address is resolved by digest, not AES-GCM."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="TestPassword123!"
+        )
+        user = User.objects.get(pk=user.pk)  # Nothing decrypted yet
+
+        with (
+            patch('accounts.models.encrypt_email') as mock_encrypt,
+            patch('accounts.models.decrypt_email') as mock_decrypt,
+        ):
+            user.email = " Test@Example.com"
+            self.assertEqual(user.email, "test@example.com")
+            mock_encrypt.assert_not_called()
+            mock_decrypt.assert_not_called()
+
+    def test_save_of_loaded_user_skips_reencryption(self):
+        """Test that saving a reloaded user without an email change doesn't re-encrypt."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="TestPassword123!"
+        )
+        user = User.objects.get(pk=user.pk)
+        user.first_name = "Test"
+
+        with patch('accounts.models.encrypt_email') as mock_encrypt:
+            user.save()
+            mock_encrypt.assert_not_called()
+
+    def test_partial_save_with_changed_email_updates_ciphertext(self):
+        """Test that save(update_fields=['email']) also writes the new ciphertext and digest."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="old@example.com",
+            password="TestPassword123!"
+        )
+        user = User.objects.get(pk=user.pk)
+        user.email = "new@example.com"
+        user.save(update_fields=["email"])
+
+        user = User.objects.get(pk=user.pk)
+        self.assertEqual(user.email_digest, generate_email_digest("new@example.com"))
+        self.assertEqual(user.email_decrypted, "new@example.com")
+
+    def test_email_is_not_stored_in_plaintext(self):
+        """Test that user.email is a property over the encrypted columns."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="Test@Example.com",
+            password="TestPassword123!"
+        )
+
+        with self.assertRaises(FieldDoesNotExist):
+            User._meta.get_field("email")
+
+        user = User.objects.get(pk=user.pk)
+        self.assertEqual(user.email, "test@example.com")
+
+        # Re-assigning the same address (as AbstractUser.clean() does) is a no-op
+        with patch('accounts.models.encrypt_email') as mock_encrypt:
+            user.email = "test@example.com"
+            mock_encrypt.assert_not_called()
+
+    def test_superuser_without_email(self):
+        """Test that superusers may be created without an email."""
+        user = User.objects.create_superuser(username="admin", password="TestPassword123!")
+
+        user = User.objects.get(pk=user.pk)
+        self.assertEqual(user.email, "")
+        self.assertIsNone(user.email_digest)
+
+        with self.assertRaises(ValueError):
+            User.objects.create_user(username="nomail", email="", password="TestPassword123!")
+
+    def test_bulk_create_users(self):
+        """Test that bulk_create_users encrypts, hashes and creates profiles."""
+        users = User.objects.bulk_create_users([
+            {"username": "Bulk1", "email": "Bulk1@Example.com", "password": "TestPassword123!"},
+            {"username": "bulk2", "email": "bulk2@example.com", "password": "TestPassword123!",
+             "first_name": "Second"},
+        ])
+
+        self.assertEqual([user.username for user in users], ["Bulk1", "bulk2"])
+        for user in users:
+            self.assertIsNotNone(user.pk)
+            self.assertTrue(hasattr(user, "profile"))
+
+        first = User.objects.get(username="Bulk1")
+        self.assertEqual(first.username_lower, "bulk1")
+        self.assertEqual(first.email_decrypted, "bulk1@example.com")
+        self.assertEqual(first.email_digest, generate_email_digest("bulk1@example.com"))
+        self.assertTrue(first.check_password("TestPassword123!"))
+        self.assertEqual(first.profile.display_name, "Bulk1")
+        self.assertEqual(User.objects.get(username="bulk2").first_name, "Second")
+
+    def test_bulk_create_users_batches_inserts(self):
+        """Test that batch_size splits the user INSERTs."""
+        rows = [
+            {"username": f"batch{i}", "email": f"batch{i}@example.com", "password": "TestPassword123!"}
+            for i in range(3)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            User.objects.bulk_create_users(rows, batch_size=2)
+
+        user_inserts = [q for q in queries if q["sql"].startswith('INSERT INTO "accounts_user"')]
+        self.assertEqual(len(user_inserts), 2)
+        self.assertEqual(User.objects.filter(username__startswith="batch").count(), 3)
+
+    def test_bulk_create_users_requires_email(self):
+        """Test that a row without an email fails before anything is encrypted."""
+        rows = [
+            {"username": "bulkok", "email": "bulkok@example.com", "password": "TestPassword123!"},
+            {"username": "bulknomail", "email": "", "password": "TestPassword123!"},
+        ]
+
+        with patch("accounts.models.encrypt_emails") as encrypt:
+            with self.assertRaisesMessage(ValueError, "The email must be set"):
+                User.objects.bulk_create_users(rows)
+
+        encrypt.assert_not_called()
+        self.assertFalse(User.objects.filter(username__startswith="bulk").exists())
+
     def test_find_by_email_method(self):
         """Test User.find_by_email() static method."""
         email = "alice@example.com"
@@ -268,6 +556,9 @@ class UserModelEncryptionTestCase(TestCase):
 class SignupFormEncryptionTestCase(TestCase):
     """Test SignupForm with encrypted emails."""
 
+    def setUp(self):
+        cache.clear()
+
     def test_signup_form_detects_duplicate_email(self):
         """Test that SignupForm detects duplicate emails using digest."""
         # Create existing user
@@ -329,6 +620,23 @@ class SignupFormEncryptionTestCase(TestCase):
         # Should be able to decrypt
         self.assertEqual(user.email_decrypted, "new@example.com")
 
+    def test_signup_form_save_reuses_email_digest(self):
+        """Test that SignupForm.save() does not recompute the email digest."""
+        form = SignupForm(data={
+            "username": "newuser",
+            "email": "new@example.com",
+            "password": "NewPassword123!",
+            "confirm_password": "NewPassword123!",
+        })
+
+        self.assertTrue(form.is_valid())
+
+        with patch('accounts.models.generate_email_digest') as mock_digest:
+            user = form.save()
+
+        mock_digest.assert_not_called()
+        self.assertEqual(user.email_digest, generate_email_digest("new@example.com"))
+
 
 class LoginFormEncryptionTestCase(TestCase):
     """Test LoginForm with encrypted emails."""
@@ -424,6 +732,7 @@ class SignupViewEncryptionTestCase(TestCase):
     """Test signup view with encrypted emails."""
 
     def setUp(self):
+        cache.clear()
         self.client = Client()
 
     def test_signup_creates_encrypted_email(self):
@@ -1,22 +1,183 @@
 """Tests for the accounts app authentication flows."""
 from __future__ import annotations
 
+import json
+import tempfile
 from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.db.utils import OperationalError
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.db.utils import IntegrityError, OperationalError
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from .models import AuthenticationEvent, Profile
+from .encryption import generate_email_digest
+from .forms import ChangeUsernameForm, LoginForm, ProfileForm, SignupForm, validate_password_strength
+from .models import AuthenticationEvent, Profile, suppress_profile_creation
 
 User = get_user_model()
 
 
+class PasswordStrengthTests(SimpleTestCase):
+    def assert_rejected_with(self, password: str, message: str) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            validate_password_strength(password)
+        self.assertIn(message, ctx.exception.messages)
+
+    def test_strong_password_passes(self) -> None:
+        validate_password_strength("StrongPass1!xy")
+
+    def test_each_missing_rule_is_reported(self) -> None:
+        self.assert_rejected_with("Short1!", "Password must be at least 12 characters long.")
+        self.assert_rejected_with("lowercase only1!", "Include at least one uppercase letter.")
+        self.assert_rejected_with("No Digits Here!", "Include at least one number.")
+        self.assert_rejected_with("NoSpecials12345", "Include at least one special character (!@#$%^&*).")
+
+    def test_all_failures_are_reported_together(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            validate_password_strength("short")
+        self.assertEqual(len(ctx.exception.messages), 4)
+
+
+class SignupFormTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_mismatched_passwords_skip_strength_validators(self) -> None:
+        form = SignupForm(
+            data={
+                "username": "mismatch",
+                "email": "mismatch@example.com",
+                "password": "StrongPass1!",
+                "confirm_password": "StrongPass2!",
+            }
+        )
+        with mock.patch("accounts.forms.password_validation.validate_password") as validate:
+            self.assertFalse(form.is_valid())
+
+        validate.assert_not_called()
+        self.assertIn("Passwords do not match.", form.errors["confirm_password"])
+
+    def test_uniqueness_checks_are_cached(self) -> None:
+        data = {
+            "username": "cacheduser",
+            "email": "cached@example.com",
+            "password": "StrongPass1!",
+            "confirm_password": "StrongPass1!",
+        }
+        with self.assertNumQueries(1):
+            self.assertTrue(SignupForm(data=data).is_valid())
+        with self.assertNumQueries(0):
+            self.assertTrue(SignupForm(data=data).is_valid())
+
+    def test_rejected_password_validation_is_memoized(self) -> None:
+        data = {
+            "username": "memo",
+            "email": "memo@example.com",
+            "password": "password1234",
+            "confirm_password": "password1234",
+        }
+        with mock.patch(
+            "accounts.forms.password_validation.validate_password",
+            side_effect=ValidationError("This password is too common."),
+        ) as validate:
+            # Overriding the policy clears the memo on entry and on exit
+            with self.settings(AUTH_PASSWORD_VALIDATORS=[]):
+                first = SignupForm(data=data)
+                second = SignupForm(data=data)
+                self.assertFalse(first.is_valid())
+                self.assertFalse(second.is_valid())
+
+        validate.assert_called_once_with("password1234")
+        self.assertIn("This password is too common.", second.errors["password"])
+
+    def test_duplicate_email_reported_on_email_field(self) -> None:
+        User.objects.create_user(
+            username="original",
+            email="taken@example.com",
+            password="ComplexPass1!",
+        )
+        form = SignupForm(
+            data={
+                "username": "newcomer",
+                "email": "Taken@Example.com",
+                "password": "StrongPass1!",
+                "confirm_password": "StrongPass1!",
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("That email is already registered.", form.errors["email"])
+        self.assertNotIn("username", form.errors)
+
+    def test_save_reports_email_taken_by_concurrent_signup(self) -> None:
+        form = SignupForm(
+            data={
+                "username": "racer",
+                "email": "race@example.com",
+                "password": "StrongPass1!",
+                "confirm_password": "StrongPass1!",
+            }
+        )
+        self.assertTrue(form.is_valid())
+
+        # Another request registers the same email after validation
+        User.objects.create_user(
+            username="winner",
+            email="race@example.com",
+            password="ComplexPass1!",
+        )
+
+        self.assertIsNone(form.save())
+        self.assertIn("That email is already registered.", form.errors["email"])
+        self.assertFalse(User.objects.filter(username="racer").exists())
+
+    def test_creating_user_clears_cached_uniqueness(self) -> None:
+        digest = generate_email_digest("cached@example.com")
+        self.assertEqual(User.objects.registration_conflicts("cacheduser", digest), (False, False))
+        User.objects.create_user(
+            username="CachedUser",
+            email="cached@example.com",
+            password="ComplexPass1!",
+        )
+        self.assertEqual(User.objects.registration_conflicts("cacheduser", digest), (True, True))
+
+    def test_renaming_user_clears_cached_old_username(self) -> None:
+        user = User.objects.create_user(
+            username="OldName",
+            email="rename@example.com",
+            password="ComplexPass1!",
+        )
+        digest = generate_email_digest("other@example.com")
+        self.assertEqual(User.objects.registration_conflicts("oldname", digest), (True, False))
+
+        user.username = "NewName"
+        user.save(update_fields=["username"])
+
+        self.assertEqual(User.objects.registration_conflicts("oldname", digest), (False, False))
+
+    def test_partial_save_of_other_fields_keeps_cached_uniqueness(self) -> None:
+        user = User.objects.create_user(
+            username="loginuser",
+            email="login@example.com",
+            password="ComplexPass1!",
+        )
+        with mock.patch("accounts.models.cache.delete_many") as delete_many:
+            user.save(update_fields=["last_login"])
+        delete_many.assert_not_called()
+
+
 class SignupViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.url = reverse("accounts:signup")
+
     def setUp(self) -> None:
+        cache.clear()
         self.client = Client(HTTP_USER_AGENT="pytest")
-        self.url = reverse("accounts:signup")
 
     def test_signup_success_creates_user_and_logs_event(self) -> None:
         response = self.client.post(
@@ -36,6 +197,7 @@ class SignupViewTests(TestCase):
         self.assertTrue(user.check_password("StrongPass1!"))
         self.assertEqual(AuthenticationEvent.objects.filter(user=user, successful=True).count(), 1)
 
+    @override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.Argon2PasswordHasher"])
     def test_signup_password_hashed_with_argon2(self) -> None:
         response = self.client.post(
             self.url,
@@ -67,6 +229,24 @@ class SignupViewTests(TestCase):
         self.assertContains(response, "Password must be at least 12 characters long.")
         self.assertFalse(User.objects.filter(username="weakpass").exists())
 
+    def test_signup_rejects_username_differing_only_in_case(self) -> None:
+        User.objects.create_user(
+            username="CaseUser",
+            email="case@example.com",
+            password="StrongPass1!",
+        )
+        response = self.client.post(
+            self.url,
+            {
+                "username": "caseuser",
+                "email": "other@example.com",
+                "password": "StrongPass1!",
+                "confirm_password": "StrongPass1!",
+            },
+            REMOTE_ADDR="198.51.100.15",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "That username is already taken.")
 
     def test_signup_gracefully_handles_missing_audit_table(self) -> None:
         with mock.patch(
@@ -91,14 +271,17 @@ class SignupViewTests(TestCase):
         self.assertTrue(User.objects.filter(username="resilient").exists())
 
 class LoginViewTests(TestCase):
-    def setUp(self) -> None:
-        self.client = Client(HTTP_USER_AGENT="pytest")
-        self.url = reverse("accounts:login")
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
             username="existing",
             email="existing@example.com",
             password="ComplexPass1!",
         )
+        cls.url = reverse("accounts:login")
+
+    def setUp(self) -> None:
+        self.client = Client(HTTP_USER_AGENT="pytest")
 
     def test_login_success_redirects(self) -> None:
         response = self.client.post(
@@ -110,6 +293,25 @@ class LoginViewTests(TestCase):
         self.assertEqual(response.headers["Location"], reverse("menu:catalog"))
         self.assertTrue(AuthenticationEvent.objects.filter(user=self.user, successful=True).exists())
 
+    def test_login_success_query_count(self) -> None:
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                self.url,
+                {"identifier": "existing", "password": "ComplexPass1!"},
+                REMOTE_ADDR="203.0.113.7",
+            )
+        self.assertEqual(response.status_code, 302)
+
+        # Only the login view's own queries: session backend SQL and
+        # savepoints vary with the Django version and session engine
+        app_queries = [
+            query["sql"] for query in ctx.captured_queries
+            if "django_session" not in query["sql"]
+            and not query["sql"].upper().startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT"))
+        ]
+        # user lookup, last_login update, audit event insert
+        self.assertEqual(len(app_queries), 3, app_queries)
+
     def test_login_with_email_identifier(self) -> None:
         response = self.client.post(
             self.url,
@@ -122,6 +324,42 @@ class LoginViewTests(TestCase):
         event = AuthenticationEvent.objects.get(user=self.user, successful=True)
         self.assertEqual(event.username_submitted, "existing@example.com")
 
+    def test_login_username_is_case_insensitive(self) -> None:
+        response = self.client.post(
+            self.url,
+            {"identifier": "EXISTING", "password": "ComplexPass1!"},
+            REMOTE_ADDR="203.0.113.16",
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(AuthenticationEvent.objects.filter(user=self.user, successful=True).exists())
+
+    def test_find_user_defers_email_columns(self) -> None:
+        form = LoginForm(data={"identifier": "existing", "password": "ComplexPass1!"})
+        user = form.find_user()
+
+        self.assertEqual(user, self.user)
+        self.assertIn("encrypted_email", user.get_deferred_fields())
+        # login()'s last_login update must not load the deferred columns
+        with self.assertNumQueries(1):
+            user.save(update_fields=["last_login"])
+
+    def test_find_user_hashes_email_identifier_once(self) -> None:
+        form = LoginForm(data={"identifier": "existing@example.com", "password": "x"})
+        with mock.patch(
+            "accounts.forms.generate_email_digest", wraps=generate_email_digest
+        ) as digest:
+            self.assertEqual(form.find_user(), self.user)
+            self.assertEqual(form.find_user(), self.user)
+
+        digest.assert_called_once_with("existing@example.com")
+
+    def test_find_user_rejects_malformed_identifiers_without_query(self) -> None:
+        for identifier in ("two words", "a@b@c", "bad@ domain.com", "semi;colon"):
+            form = LoginForm(data={"identifier": identifier, "password": "x"})
+            self.assertTrue(form.is_valid())
+            with self.assertNumQueries(0):
+                self.assertIsNone(form.find_user())
+
     def test_login_wrong_password_shows_error(self) -> None:
         response = self.client.post(
             self.url,
@@ -138,14 +376,17 @@ class LoginViewTests(TestCase):
 
 
 class ProfileViewTests(TestCase):
-    def setUp(self) -> None:
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
             username="profileuser",
             email="profile@example.com",
             password="ComplexPass1!",
         )
-        self.url = reverse("accounts:profile")
+        cls.url = reverse("accounts:profile")
+
+    def setUp(self) -> None:
+        self.client = Client()
 
     def test_profile_requires_login(self) -> None:
         response = self.client.get(self.url)
@@ -153,7 +394,7 @@ class ProfileViewTests(TestCase):
         self.assertIn(reverse("accounts:login"), response.headers["Location"])
 
     def test_profile_update_persists_changes(self) -> None:
-        self.client.login(username="profileuser", password="ComplexPass1!")
+        self.client.force_login(self.user)
         response = self.client.post(
             self.url,
             {
@@ -171,23 +412,172 @@ class ProfileViewTests(TestCase):
         self.assertEqual(profile.favorite_drink, "Cold Brew")
         self.assertIn("Prefers light roast beans.", profile.bio)
 
+    def test_profile_update_refreshes_cached_display_name(self) -> None:
+        self.assertEqual(self.user.display_name_cached, "profileuser")
+        self.client.force_login(self.user)
+        response = self.client.post(
+            self.url,
+            {"display_name": "Brews Fan", "update_profile": "true"},
+        )
+
+        self.assertContains(response, "Hi, Brews Fan!")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.display_name_cached, "Brews Fan")
+
+    def test_change_username_rejects_name_taken_after_validation(self) -> None:
+        User.objects.create_user(
+            username="racewinner",
+            email="winner@example.com",
+            password="ComplexPass1!",
+        )
+        self.client.force_login(self.user)
+        # Simulate another user taking the name between clean() and save()
+        with mock.patch.object(
+            ChangeUsernameForm, "clean_new_username", lambda form: form.cleaned_data["new_username"]
+        ):
+            response = self.client.post(
+                self.url,
+                {
+                    "new_username": "RaceWinner",
+                    "password": "ComplexPass1!",
+                    "change_username": "true",
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "That username is already taken.")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, "profileuser")
+
+    def test_profile_save_without_name_change_skips_user_update(self) -> None:
+        profile = Profile.objects.select_related("user").get(user=self.user)
+        profile.bio = "Oat milk, always."
+
+        with self.assertNumQueries(1):
+            profile.save()
+
+
+class DashboardFormStylingTests(SimpleTestCase):
+    def test_dashboard_class_applied_once_per_field(self) -> None:
+        ProfileForm()
+        form = ProfileForm()
+        for field in form.fields.values():
+            self.assertEqual(field.widget.attrs["class"], "dashboard-input")
+
+
+class UserManagerTests(TestCase):
+    def test_create_user_rolls_back_when_profile_insert_fails(self) -> None:
+        with mock.patch(
+            "accounts.models.Profile.objects.create", side_effect=OperationalError("boom")
+        ):
+            with self.assertRaises(OperationalError):
+                User.objects.create_user(
+                    username="noprofile",
+                    email="noprofile@example.com",
+                    password="ComplexPass1!",
+                )
+
+        self.assertFalse(User.objects.filter(username="noprofile").exists())
+
+    def test_encrypted_email_is_deferred_but_loads_on_access(self) -> None:
+        created = User.objects.create_user(
+            username="deferred",
+            email="deferred@example.com",
+            password="ComplexPass1!",
+        )
+        user = User.objects.get(pk=created.pk)
+
+        self.assertIn("encrypted_email", user.get_deferred_fields())
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email_decrypted, "deferred@example.com")
+
+    async def test_acreate_user_hashes_off_thread_and_saves(self) -> None:
+        user = await User.objects.acreate_user(
+            username="asyncuser",
+            email="Async@Example.com",
+            password="ComplexPass1!",
+        )
+
+        self.assertTrue(user.check_password("ComplexPass1!"))
+        saved = await User.objects.select_related("profile").aget(username_lower="asyncuser")
+        self.assertEqual(saved.email_digest, generate_email_digest("async@example.com"))
+        self.assertEqual(saved.profile.display_name, "asyncuser")
+
+    def test_fixture_load_keeps_fixture_profile(self) -> None:
+        fixture = [
+            {"model": "accounts.user", "pk": 50, "fields": {
+                "username": "fixtureuser", "username_lower": "fixtureuser", "password": "!",
+            }},
+            {"model": "accounts.profile", "pk": 50, "fields": {
+                "user": 50, "display_name": "From Fixture", "updated_at": "2025-01-01T00:00:00Z",
+            }},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as handle:
+            json.dump(fixture, handle)
+            handle.flush()
+            call_command("loaddata", handle.name, verbosity=0)
+
+        self.assertEqual(Profile.objects.get(user_id=50).display_name, "From Fixture")
+
+    def test_suppress_profile_creation(self) -> None:
+        with suppress_profile_creation():
+            user = User.objects.create_user(
+                username="importer",
+                email="importer@example.com",
+                password="ComplexPass1!",
+            )
+
+        self.assertFalse(Profile.objects.filter(user=user).exists())
+
+
+class UsernameLowerTests(TestCase):
+    def test_username_lower_follows_partial_username_save(self) -> None:
+        user = User.objects.create_user(
+            username="MixedCase",
+            email="mixed@example.com",
+            password="ComplexPass1!",
+        )
+        self.assertEqual(user.username_lower, "mixedcase")
+
+        user.username = "Renamed.User"
+        user.save(update_fields=["username"])
+
+        user.refresh_from_db()
+        self.assertEqual(user.username_lower, "renamed.user")
+
+    def test_username_lower_is_unique(self) -> None:
+        User.objects.create_user(
+            username="CaseUser",
+            email="case1@example.com",
+            password="ComplexPass1!",
+        )
+        with self.assertRaises(IntegrityError):
+            User.objects.create_user(
+                username="caseuser",
+                email="case2@example.com",
+                password="ComplexPass1!",
+            )
+
 
 class LogoutViewTests(TestCase):
-    def setUp(self) -> None:
-        self.client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
             username="logoutuser",
             email="logout@example.com",
             password="ComplexPass1!",
         )
-        self.url = reverse("accounts:logout")
+        cls.url = reverse("accounts:logout")
+
+    def setUp(self) -> None:
+        self.client = Client()
 
     def test_logout_requires_post(self) -> None:
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 405)
 
     def test_logout_clears_session(self) -> None:
-        self.client.login(username="logoutuser", password="ComplexPass1!")
+        self.client.force_login(self.user)
         response = self.client.post(self.url)
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.headers["Location"], reverse("pages:home"))
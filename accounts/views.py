@@ -132,10 +132,11 @@ def signup_view(request: HttpRequest) -> HttpResponse:
     form = SignupForm(request.POST or None)
 
     if request.method == "POST":
-        if form.is_valid():
-            # Create user (password automatically hashed)
-            user = form.save()
+        # Create user (password automatically hashed). save() returns None
+        # if a concurrent signup took the username/email after validation.
+        user = form.save() if form.is_valid() else None
 
+        if user is not None:
             # Auto-login after signup
             login(request, user)
 
@@ -189,6 +190,9 @@ def profile_view(request: HttpRequest) -> HttpResponse:
         user=request.user,
         defaults={"display_name": request.user.username},
     )
+    # Share request.user so Profile.save() updates its display_name_cached
+    # in memory and the page header shows the new name right away
+    profile.user = request.user
     
     # Initialize forms
     profile_form = ProfileForm(request.POST or None, instance=profile)
@@ -209,9 +213,7 @@ def profile_view(request: HttpRequest) -> HttpResponse:
     elif request.method == "POST" and "change_username" in request.POST:
         # Change username (requires password)
         username_form = ChangeUsernameForm(request.user, request.POST)
-        if username_form.is_valid():
-            request.user.username = username_form.cleaned_data["new_username"]
-            request.user.save(update_fields=['username'])
+        if username_form.is_valid() and username_form.save():
             update_success = True
             update_message = "Username changed successfully."
     
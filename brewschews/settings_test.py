@@ -0,0 +1,16 @@
+"""
+Django settings for running the test suite.
+
+Same as settings.py, except passwords are hashed with MD5: every
+create_user(), login and signup in the suite would otherwise pay Argon2's
+full cost (~0.3 s per hash). Tests that check the production hasher opt
+back in with override_settings(PASSWORD_HASHERS=[Argon2...]).
+
+manage.py uses this module for `manage.py test` unless DJANGO_SETTINGS_MODULE
+or --settings says otherwise. Other runners (pytest-django, IDEs) need
+DJANGO_SETTINGS_MODULE=brewschews.settings_test.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
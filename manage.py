@@ -6,6 +6,10 @@ import sys
 
 def main() -> None:
     """Run administrative tasks."""
+    # `manage.py test` defaults to the fast-hasher test settings; an explicit
+    # DJANGO_SETTINGS_MODULE or --settings still wins
+    if sys.argv[1:2] == ["test"]:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brewschews.settings_test")
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brewschews.settings")
     try:
         from django.core.management import execute_from_command_line
@@ -8,15 +8,18 @@ User = get_user_model()
 
 
 class OrdersDashboardUITests(TestCase):
-    def setUp(self) -> None:
-        self.anonymous_client = Client()
-        self.authenticated_client = Client()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
             username="dashuser",
             email="dash@example.com",
             password="SecurePass1!",
         )
-        self.authenticated_client.login(username="dashuser", password="SecurePass1!")
+
+    def setUp(self) -> None:
+        self.anonymous_client = Client()
+        self.authenticated_client = Client()
+        self.authenticated_client.force_login(self.user)
 
     def test_cart_view_requires_authentication(self) -> None:
         response = self.anonymous_client.get(reverse("orders:cart"))
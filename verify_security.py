@@ -33,9 +33,9 @@ from accounts.encryption import (
     encrypt_email,
     decrypt_email,
     generate_email_digest,
-    test_encryption_roundtrip
 )
 from django.contrib.auth.hashers import make_password, check_password
+from django.core.management import call_command
 
 
 def print_header(text):
@@ -75,7 +75,7 @@ def view_database_raw():
     # Get all users
     print_section("User Accounts (Raw Database View)")
     cursor.execute("""
-        SELECT id, username, email, encrypted_email, email_digest, password
+        SELECT id, username, encrypted_email, email_digest, password
         FROM accounts_user
     """)
 
@@ -86,9 +86,8 @@ def view_database_raw():
         print("\nCreate a test user with:")
         print("    python manage.py shell -c \"from accounts.models import User; User.objects.create_user('testuser', 'test@example.com', 'TestPassword123!')\"")
     else:
-        for idx, (user_id, username, email, encrypted_email, email_digest, password_hash) in enumerate(users, 1):
+        for idx, (user_id, username, encrypted_email, email_digest, password_hash) in enumerate(users, 1):
             print(f"\n👤 User #{user_id}: {username}")
-            print(f"   Plaintext Email (legacy):  {email or '(empty)'}")
 
             if encrypted_email:
                 # Show encrypted email as hex for readability
@@ -224,7 +223,7 @@ def test_email_encryption():
     # Run roundtrip test
     print(f"\n✅ Running encryption roundtrip test...")
     try:
-        test_encryption_roundtrip()
+        call_command("check_email_encryption")
         print("   ✅ Encryption roundtrip test PASSED")
     except Exception as e:
         print(f"   ❌ Encryption roundtrip test FAILED: {e}")